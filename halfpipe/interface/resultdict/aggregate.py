@@ -7,6 +7,7 @@ from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Tuple, Sequ
 
 from dataclasses import fields
 from collections import defaultdict, Counter
+from functools import partial
 from math import isclose
 
 import numpy as np
@@ -181,7 +182,7 @@ def aggregate_field(key, value):
 
 
 def group_resultdicts(inputs, across):
-    grouped_resultdicts = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    grouped_resultdicts = defaultdict(partial(defaultdict, partial(defaultdict, list)))
 
     for resultdict in sorted(inputs, key=lambda d: d["tags"][across]):
         result = schema.load(data=resultdict)
@@ -27,6 +27,8 @@ class Database:
         self.filepaths_by_tags = dict()
         self.tags_by_filepaths = dict()
 
+        self.associations_cache = dict()
+
         for file_obj in self.resolved_spec.resolved_files:
             self.index(file_obj)
 
@@ -46,6 +48,8 @@ class Database:
             self.index(resolved_fileobj)
 
     def index(self, fileobj):
+        self.associations_cache.clear()  # invalidate
+
         def add_tag_to_index(filepath, entity, tagval):
             if tagval is None:
                 return
@@ -118,6 +122,19 @@ class Database:
         if tagdict is not None:
             return tagdict.get(entity)
 
+    def multitagvals(self, entitylist, filepaths):
+        """
+        get a dictionary of filepath -> entity -> value for multiple filepaths
+        in a single pass, instead of calling tagval for each combination
+        """
+        res = dict()
+        for filepath in filepaths:
+            tagdict = self.tags_by_filepaths.get(filepath)
+            if tagdict is None:
+                tagdict = dict()
+            res[filepath] = {entity: tagdict.get(entity) for entity in entitylist}
+        return res
+
     def tagvaldict(self, entity):
         return self.filepaths_by_tags.get(entity)
 
@@ -161,9 +178,11 @@ class Database:
                 values = filter.get("values")
                 assert isinstance(values, (list, tuple))
 
+                # res is a subset of filepaths, so we can use the index sets directly
+                # instead of intersecting filepaths with each of them
                 filterset = set()
                 for value in values:
-                    filterset |= self.filter(filepaths, **{entity: value})
+                    filterset |= self.filepaths_by_tags[entity][value]
 
                 action = filter.get("action")
 
@@ -187,15 +206,20 @@ class Database:
         return True
 
     def associations(self, filepath, **filters):
+        key = (filepath, tuple(sorted(filters.items())))
+        if key not in self.associations_cache:
+            self.associations_cache[key] = self._associations(filepath, **filters)
+        return self.associations_cache[key]
+
+    def _associations(self, filepath, **filters):
         res = self.get(**filters)
         for entity in reversed(entities):  # from high to low priority
             if entity not in self.filepaths_by_tags:
                 continue
             cur_set = set()
-            for _, filepaths in self.filepaths_by_tags[entity].items():
+            for filepaths in self.filepaths_by_tags[entity].values():
                 if filepath in filepaths:
-                    cur_set |= set(filepaths)
-            cur_set &= res
+                    cur_set |= filepaths & res
             if len(cur_set) > 0:
                 res = cur_set
             if len(cur_set) == 1:
@@ -4,6 +4,7 @@
 
 from typing import Optional, Tuple, Dict
 
+import os
 import re
 
 import nibabel as nib
@@ -68,14 +69,19 @@ class NiftiheaderLoader:
 
     @classmethod
     def load(cls, niftifile) -> Tuple[Optional[nib.Nifti1Header], Optional[Dict]]:
-        if niftifile in cls.cache:
-            return cls.cache[niftifile]
-
         _, ext = splitext(niftifile)
 
         if ext in [".mat"]:
             return None, None
 
+        try:  # invalidate the cache when the file is modified
+            key = (niftifile, os.stat(niftifile).st_mtime_ns)
+        except OSError:
+            key = (niftifile, None)
+
+        if key in cls.cache:
+            return cls.cache[key]
+
         try:
             nbimg = nib.load(niftifile, mmap=False, keep_file_open=False)
         except Exception as e:
@@ -90,5 +96,5 @@ class NiftiheaderLoader:
             logger.info(f'Could not parse nii file descrip for "{niftifile:s}: %s"', e, exc_info=True)
             descripdict = dict()
 
-        cls.cache[niftifile] = header, descripdict
+        cls.cache[key] = header, descripdict
         return header, descripdict
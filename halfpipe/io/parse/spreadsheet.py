@@ -9,6 +9,7 @@
 from typing import Optional
 
 from functools import lru_cache
+import os
 import warnings
 import re
 import csv
@@ -30,8 +31,15 @@ def str_is_convertible_to_float(value: str) -> bool:
         return False
 
 
-@lru_cache(maxsize=1024)
 def loadspreadsheet(file_name, extension=None, **kwargs) -> pd.DataFrame:
+    stat_result = os.stat(file_name)  # read the file again when it is modified
+    return _loadspreadsheet(
+        file_name, stat_result.st_mtime_ns, stat_result.st_size, extension=extension, **kwargs
+    )
+
+
+@lru_cache(maxsize=1024)
+def _loadspreadsheet(file_name, st_mtime_ns, st_size, extension=None, **kwargs) -> pd.DataFrame:
     if extension is None:
         _, extension = splitext(file_name)
 
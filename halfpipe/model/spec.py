@@ -6,11 +6,12 @@
 
 """
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 import logging
 import os
 from os import path as op
 from datetime import datetime as dt
+from functools import lru_cache
 import uuid
 
 from marshmallow import (
@@ -30,7 +31,7 @@ from .file import File, FileSchema
 from .setting import SettingSchema, GlobalSettingsSchema
 from .feature import FeatureSchema
 from .model import ModelSchema
-from ..utils import hexdigest, timestampfmt
+from ..utils import deepcopyfactory, hexdigest, timestampfmt
 
 entity_aliases = {"direction": "phase_encoding_direction"}
 namespace = uuid.UUID("be028ae6-9a73-11ea-8002-000000000000")  # constant
@@ -138,6 +139,21 @@ class Spec:
         self.files.append(fileobj)
 
 
+@lru_cache(maxsize=8)
+def _loadspecfactory(specpath: str, st_ino: int, st_mtime_ns: int, st_size: int) -> Callable[[], Spec]:
+    """
+    the spec file is loaded both by the user interface and by the workflow, and
+    schema validation is expensive, so we cache a factory for copies of the result
+    """
+    with open(specpath, "r") as f:
+        jsn = f.read()
+
+    spec = SpecSchema().loads(jsn, many=False)
+    assert isinstance(spec, Spec)
+
+    return deepcopyfactory(spec)
+
+
 def loadspec(workdir=None, timestamp=None, specpath=None, logger=logging.getLogger("halfpipe")) -> Optional[Spec]:
     if specpath is None:
         assert workdir is not None
@@ -151,13 +167,13 @@ def loadspec(workdir=None, timestamp=None, specpath=None, logger=logging.getLogg
         return None
 
     logger.info(f"Loading spec file {specpath}")
-    with open(specpath, "r") as f:
-        jsn = f.read()
+    stat_result = os.stat(specpath)  # the inode changes when the file is replaced
 
     try:
-        spec = SpecSchema().loads(jsn, many=False)
-        assert isinstance(spec, Spec)
-        return spec
+        specfactory = _loadspecfactory(
+            specpath, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+        )
+        return specfactory()
 
     except marshmallow.exceptions.ValidationError as e:
         logger.warning(f'Ignored validation error in "{specpath}"', exc_info=e)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+
+import os
+
+from ..spec import Spec, SpecSchema, loadspec, savespec
+
+
+def make_spec(dummy_scans: int) -> Spec:
+    spec_schema = SpecSchema()
+    spec = spec_schema.load(spec_schema.dump({}), partial=True)
+    assert isinstance(spec, Spec)
+    spec.global_settings["dummy_scans"] = dummy_scans
+    return spec
+
+
+def test_loadspec_rewritten(tmp_path):
+    workdir = str(tmp_path)
+    specpath = os.path.join(workdir, "spec.json")
+
+    savespec(make_spec(1), workdir=workdir)
+    stat_result = os.stat(specpath)
+
+    spec = loadspec(workdir=workdir)
+    assert spec is not None
+    assert spec.global_settings["dummy_scans"] == 1
+
+    # rewrite with the same size within the same modification time tick
+    savespec(make_spec(2), workdir=workdir)
+    os.utime(specpath, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+
+    new_stat_result = os.stat(specpath)
+    assert new_stat_result.st_size == stat_result.st_size
+    assert new_stat_result.st_mtime_ns == stat_result.st_mtime_ns
+
+    spec = loadspec(workdir=workdir)
+    assert spec is not None
+    assert spec.global_settings["dummy_scans"] == 2
+
+    spec.global_settings["dummy_scans"] = 3  # callers get a copy
+
+    spec = loadspec(workdir=workdir)
+    assert spec is not None
+    assert spec.global_settings["dummy_scans"] == 2
@@ -190,6 +190,7 @@ class MultiProcPlugin(nip.MultiProcPlugin):
         if self._rt is not None:
             paths = [*self._rt.collect()]
             if len(paths) > 0:
-                logger.info("[node dependencies finished] removing\n" + "\n".join(map(str, paths)))
+                if logger.isEnabledFor(logging.INFO):  # skip building the message if unused
+                    logger.info("[node dependencies finished] removing\n" + "\n".join(map(str, paths)))
                 for path in paths:
                     shutil.rmtree(path, ignore_errors=True)
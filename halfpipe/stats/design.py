@@ -237,7 +237,8 @@ def group_design(
                 lsmeans.loc[level] = reference_rows.mean()
 
             value_dict = contrastdict["values"]
-            names = [name for name in value_dict.keys() if name in variable_levels]
+            variable_level_set = set(variable_levels)
+            names = [name for name in value_dict.keys() if name in variable_level_set]
             values = [value_dict[name] for name in names]
 
             # If we wish to test the mean of each group against zero,
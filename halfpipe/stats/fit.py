@@ -8,6 +8,7 @@
 from typing import ContextManager, List, Dict, Optional, Tuple
 
 from collections import defaultdict
+from functools import partial
 import os
 from pathlib import Path
 from multiprocessing import get_context
@@ -146,7 +147,7 @@ def fit(
         it = cm.imap_unordered(voxel_calc, voxel_data)
 
     # run
-    voxel_results = defaultdict(lambda: defaultdict(dict))
+    voxel_results = defaultdict(partial(defaultdict, dict))
     with cm:
         for x in tqdm(it, unit="voxels"):
             if x is None:
@@ -100,8 +100,18 @@ class UseExistingSpecStep(Step):
             models = self.existing_spec.models
 
             if choice_index > 1:
+                # resolve and index the files in one pass instead of calling
+                # put for each file, which checks against all previous files.
+                # like Spec.put, we keep only the first file for each path
+                filepaths = set(fileobj.path for fileobj in ctx.spec.files)
+                new_files = list()
                 for fileobj in files:
-                    ctx.put(fileobj)
+                    if fileobj.path in filepaths:
+                        continue
+                    filepaths.add(fileobj.path)
+                    new_files.append(fileobj)
+                ctx.spec.files = [*ctx.spec.files, *new_files]
+                ctx.database = Database(ctx.spec)
             if choice_index > 2:
                 ctx.spec.settings = settings
                 ctx.spec.features = features
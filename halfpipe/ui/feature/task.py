@@ -6,8 +6,10 @@
 
 """
 
+import os
 from abc import abstractmethod
-from typing import List, Type
+from functools import lru_cache
+from typing import FrozenSet, Hashable, Iterable, List, Optional, Tuple, Type
 
 from calamities import (
     MultiNumberInputView,
@@ -29,7 +31,6 @@ from .loop import SettingValsStep
 
 from ...io.parse.condition import parse_condition_file
 from ...model import File, TxtEventsFileSchema, TsvEventsFileSchema, MatEventsFileSchema, TContrastSchema
-from ...workflow.collect import collect_events
 
 next_step_type = SettingValsStep
 
@@ -46,65 +47,79 @@ def find_bold_filepaths(ctx):
         raise ValueError("No BOLD files in database")
 
     filters = ctx.spec.settings[-1].get("filters")
-    bold_filepaths = set(bold_filepaths)
 
+    # database.get already returns a new set, and applyfilters makes its own copy
     if filters is not None:
         bold_filepaths = database.applyfilters(bold_filepaths, filters)
 
     return bold_filepaths
 
 
-def find_and_parse_condition_files(ctx, bold_filepaths: List[str] = list()):
+def find_condition_files(ctx, bold_filepaths: Optional[Iterable[str]] = None):
     """
-    returns generator for tuple event file paths, conditions, onsets, durations
+    returns the set of event files or file tuples for the selected bold files
     """
-    database = ctx.database
-
-    if len(bold_filepaths) == 0:
-        bold_filepaths.extend(find_bold_filepaths(ctx))
+    # importing the workflow package pulls in fmriprep and nipype,
+    # so we defer this until the function is actually called
+    from ...workflow.collect import collect_events
 
-    filters = dict(datatype="func", suffix="events")
-    taskset = ctx.database.tagvalset("task", filepaths=bold_filepaths)
-    if len(taskset) == 1:
-        (filters["task"],) = taskset
+    if bold_filepaths is None:
+        bold_filepaths = find_bold_filepaths(ctx)
 
-    eventfile_dict = dict()
+    eventfile_set = set()
     for filepath in bold_filepaths:
         events = collect_events(ctx.database, filepath)
         if events is not None:
-            eventfile_dict[filepath] = events
+            eventfile_set.add(events)
 
-    eventfile_set = set(eventfile_dict.values())
-    if len(eventfile_set) == 0:
-        return
+    return frozenset(eventfile_set)
 
-    for in_any in eventfile_set:
-        if isinstance(in_any, str):
-            in_any = database.fileobj(in_any)
-        yield (in_any, *parse_condition_file(in_any=in_any))
 
+def condition_file_stat(in_any) -> Tuple:
+    """
+    returns a key that changes whenever one of the event files is modified
+    """
+    if isinstance(in_any, str):
+        filepaths = [in_any]
+    else:
+        filepaths = [filepath for filepath, _ in in_any]
 
-def get_conditions(ctx):
-    ctx.spec.features[-1].conditions = []  # create attribute
+    stat_list = list()
+    for filepath in filepaths:
+        try:
+            stat_result = os.stat(filepath)
+            stat_list.append((filepath, stat_result.st_mtime_ns, stat_result.st_size))
+        except OSError:
+            stat_list.append((filepath, None, None))
 
-    out_list = list(find_and_parse_condition_files(ctx))
-    if out_list is None or len(out_list) == 0:
-        return
+    return tuple(stat_list)
 
-    _, conditions_list, _, _ = zip(*out_list)
 
-    conditionssets = [set(conditions) for conditions in conditions_list]
-    conditions = set.union(*conditionssets)
+@lru_cache(maxsize=64)
+def parse_conditions(eventfile_stats: FrozenSet[Tuple[Hashable, Tuple]]) -> Tuple[str, ...]:
+    """
+    returns the condition names in the event files. the cache is keyed on the
+    stat results of the files, so that modified files are parsed again
+    """
+    conditions_list = [
+        parse_condition_file(in_any=in_any)[0] for in_any, _ in eventfile_stats
+    ]
+
+    # dict preserves insertion order, so this removes duplicates in order
+    return tuple(dict.fromkeys(ravel(conditions_list)))
 
-    if len(conditions) == 0:
-        return
 
-    ordered_conditions = []
-    for c in ravel(conditions_list):
-        if c in conditions and c not in ordered_conditions:
-            ordered_conditions.append(c)
+def get_conditions(ctx):
+    ctx.spec.features[-1].conditions = []  # create attribute
+
+    eventfile_set = find_condition_files(ctx)
+    if len(eventfile_set) == 0:
+        return
 
-    ctx.spec.features[-1].conditions = ordered_conditions
+    conditions = parse_conditions(frozenset(
+        (in_any, condition_file_stat(in_any)) for in_any in eventfile_set
+    ))
+    ctx.spec.features[-1].conditions = list(conditions)
 
 
 class ConfirmInconsistentStep(YesNoStep):
@@ -291,7 +306,7 @@ class ConditionsSelectStep(Step):
         self.input_view = CombinedMultipleAndSingleChoiceInputView(
             self.options,
             [self.add_file_str],
-            checked=[*self.options],
+            checked=set(self.options),
             isVertical=True,
         )
 
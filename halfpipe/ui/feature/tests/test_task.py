@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+
+import os
+from unittest import mock
+
+from ....model import Feature
+from ...base import Context
+from .. import task
+from ..task import get_conditions
+
+
+def write_events(path, conditions, mtime_ns):
+    with open(path, "w") as file_handle:
+        file_handle.write("onset\tduration\ttrial_type\n")
+        for i, condition in enumerate(conditions):
+            file_handle.write(f"{i * 10:d}\t5\t{condition}\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))  # do not rely on the file system clock
+
+
+def make_context():
+    ctx = Context()
+    ctx.spec.features.append(Feature(name="faces", type="task_based"))
+    return ctx
+
+
+def test_get_conditions_modified(tmp_path):
+    events_path = str(tmp_path / "events.tsv")
+    write_events(events_path, ["faces", "shapes"], 10 ** 18)
+
+    ctx = make_context()
+
+    with mock.patch.object(
+        task, "find_condition_files", return_value=frozenset([events_path])
+    ), mock.patch.object(
+        task, "parse_condition_file", wraps=task.parse_condition_file
+    ) as parse_condition_file:
+        get_conditions(ctx)
+        assert ctx.spec.features[-1].conditions == ["faces", "shapes"]
+        assert parse_condition_file.call_count == 1
+
+        get_conditions(ctx)  # unchanged file is not parsed again
+        assert ctx.spec.features[-1].conditions == ["faces", "shapes"]
+        assert parse_condition_file.call_count == 1
+
+        ctx.spec.features[-1].conditions.append("houses")  # callers get a copy
+        get_conditions(ctx)
+        assert ctx.spec.features[-1].conditions == ["faces", "shapes"]
+
+        write_events(events_path, ["houses", "shapes", "faces"], 2 * 10 ** 18)
+
+        get_conditions(ctx)
+        assert ctx.spec.features[-1].conditions == ["faces", "houses", "shapes"]
+        assert parse_condition_file.call_count == 2
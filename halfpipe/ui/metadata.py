@@ -3,6 +3,8 @@
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
 from typing import ClassVar, Dict, Optional, Type
+from collections import Counter
+from functools import lru_cache
 
 from calamities import (
     TextView,
@@ -29,16 +31,22 @@ from ..model import space_codes, slice_order_strs
 from ..utils import logger
 
 
-def _get_field(schema, key):
+@lru_cache(maxsize=None)
+def _get_schema_instance(schema):
     if isinstance(schema, type):
-        instance = schema()
-    else:
-        instance = schema
+        return schema()
+    return schema
+
+
+@lru_cache(maxsize=None)
+def _get_field(schema, key):
+    instance = _get_schema_instance(schema)
     if "metadata" in instance.fields:
         return _get_field(instance.fields["metadata"].nested, key)
     return instance.fields.get(key)
 
 
+@lru_cache(maxsize=None)
 def _get_unit(schema, key):
     field = _get_field(schema, key)
     if field is not None:
@@ -126,8 +134,7 @@ class SliceTimingFileStep(Step):
             filepath = self.result
             try:
                 spreadsheet = loadspreadsheet(filepath)
-                valuearray = np.ravel(spreadsheet.values).astype(np.float64)
-                valuelist = list(valuearray.tolist())
+                valuelist = spreadsheet.to_numpy(dtype=np.float64).ravel().tolist()
                 value = self.field.deserialize(valuelist)
 
                 for filepath in self.filepaths:
@@ -334,20 +341,25 @@ class CheckMetadataStep(Step):
         self.suggestion = None
 
         if self.key == "phase_encoding_direction" or self.key == "slice_encoding_direction":
-            for i, val in enumerate(vals):
-                if val is not None:
-                    vals[i] = direction_code_str(val, filepaths[i])
+            vals = [
+                direction_code_str(val, filepath) if val is not None else None
+                for val, filepath in zip(vals, filepaths)
+            ]
 
         elif self.key == "slice_timing":
+            sts_by_bytes: Dict[bytes, str] = dict()  # many files share the same values
             for i, val in enumerate(vals):
                 if val is not None:
-                    sts = slice_timing_str(val)
-                    if sts == "unknown":
-                        val = np.array(val)
-                        sts = np.array2string(val, max_line_width=16384)
-                    else:
-                        sts = humanize(sts)
-                    vals[i] = sts
+                    val = np.asarray(val)
+                    key = val.tobytes()
+                    if key not in sts_by_bytes:
+                        sts = slice_timing_str(val)
+                        if sts == "unknown":
+                            sts = np.array2string(val, max_line_width=16384)
+                        else:
+                            sts = humanize(sts)
+                        sts_by_bytes[key] = sts
+                    vals[i] = sts_by_bytes[key]
 
         if any(val is None for val in vals):
             self.is_missing = True
@@ -362,12 +374,12 @@ class CheckMetadataStep(Step):
 
         assert isinstance(vals, list)
 
-        uniquevals, counts = np.unique(vals, return_counts=True)
-        order = np.argsort(counts)
+        counter = Counter(vals)
+        most_common = counter.most_common(10)
 
         column1 = []
-        for i in range(min(10, len(order))):
-            column1.append(f"{counts[i]} images")
+        for _, count in most_common:
+            column1.append(f"{count} images")
         column1width = max(len(s) for s in column1)
 
         unit = _get_unit(self.schema, self.key)
@@ -378,16 +390,16 @@ class CheckMetadataStep(Step):
             unit = ""
 
         if self.show_summary is True:
-            for i in range(min(10, len(order))):
-                display = display_str(f"{uniquevals[i]}")
+            for i, (val, _) in enumerate(most_common):
+                display = display_str(f"{val}")
                 if self.suggestion is None:
                     self.suggestion = display
                 tablerow = f" {column1[i]:>{column1width}} - {display}"
-                if uniquevals[i] != "missing":
+                if val != "missing":
                     tablerow = f"{tablerow} {unit}"
                 self._append_view(TextView(tablerow))
 
-            if len(order) > 10:
+            if len(counter) > 10:
                 self._append_view(TextView("..."))
 
         if self.is_missing is False:
@@ -120,15 +120,18 @@ class ModelAggregateStep(Step):
         for setting in ctx.spec.settings:
             setting_filters[setting["name"]] = setting.get("filters")
 
+        entities_by_setting = dict()  # features often share a setting
         self.feature_entities = dict()
         for obj in featureobjs:
-            filters = setting_filters[obj.setting]
-            feature_filepaths = [*filepaths]
-            if filters is not None and len(filters) > 0:
-                feature_filepaths = ctx.database.applyfilters(feature_filepaths, filters)
-            self.feature_entities[obj.name], _ = ctx.database.multitagvalset(
-                aggregate_order, filepaths=feature_filepaths
-            )
+            if obj.setting not in entities_by_setting:
+                filters = setting_filters[obj.setting]
+                feature_filepaths = filepaths
+                if filters is not None and len(filters) > 0:
+                    feature_filepaths = ctx.database.applyfilters(feature_filepaths, filters)
+                entities_by_setting[obj.setting], _ = ctx.database.multitagvalset(
+                    aggregate_order, filepaths=feature_filepaths
+                )
+            self.feature_entities[obj.name] = entities_by_setting[obj.setting]
 
         entitiesset = set.union(*[set(entitylist) for entitylist in self.feature_entities.values()])
 
@@ -29,6 +29,9 @@ from .loop import AddAnotherModelStep
 from .utils import format_column
 from ...model import InferredTypeContrastSchema, TContrastSchema, MissingFilterSchema
 
+inferred_type_contrast_schema = InferredTypeContrastSchema()
+missing_filter_schema = MissingFilterSchema()
+
 next_step_type = AddAnotherModelStep
 
 
@@ -89,14 +92,15 @@ class InteractionTermsStep(Step):
         return True
 
     def next(self, ctx):
+        contrasts = ctx.spec.models[-1].contrasts
         for var_str, is_checked in self.choice.items():
             if not is_checked:
                 continue
             termtpl = list(self.term_by_str[var_str])
 
-            contrast = InferredTypeContrastSchema().load({"type": "infer", "variable": termtpl})
+            contrast = inferred_type_contrast_schema.load({"type": "infer", "variable": termtpl})
 
-            ctx.spec.models[-1].contrasts.append(contrast)
+            contrasts.append(contrast)
 
         return next_step_type(self.app)(ctx)
 
@@ -370,13 +374,14 @@ class VariableMissingActionStep(Step):
 
     def next(self, ctx):
         if self.choice is not None:
+            filters = ctx.spec.models[-1].filters
             for variable_str, value in self.choice.items():
                 varname = self.varname_by_str[variable_str]
 
-                if self.values.index(value) == 0:  # listwise deletion
+                if value == self.values[0]:  # listwise deletion
                     # create filter
-                    ctx.spec.models[-1].filters.append(
-                        MissingFilterSchema().load(
+                    filters.append(
+                        missing_filter_schema.load(
                             {
                                 "action": "exclude",
                                 "type": "missing",
@@ -421,11 +426,12 @@ class VariableSelectStep(Step):
             self.varname_by_str[option] for option, checked in self.choice.items() if checked
         )
 
+        contrasts = ctx.spec.models[-1].contrasts
         for variable in self.variables:
             if variable["name"] in checkedvarnames:
-                contrast = InferredTypeContrastSchema().load(
+                contrast = inferred_type_contrast_schema.load(
                     {"type": "infer", "variable": [variable["name"]]}
                 )
-                ctx.spec.models[-1].contrasts.append(contrast)
+                contrasts.append(contrast)
 
         return VariableMissingActionStep(self.app)(ctx)
@@ -25,6 +25,9 @@ from .loop import AddAnotherModelStep
 from .design import VariableSelectStep
 from .utils import format_column
 
+filter_schema = FilterSchema()
+group_filter_schema = GroupFilterSchema()
+
 
 def get_cutoff_filter_steps(cutoff_filter_next_step_type):
     class BaseCutoffFilterStep(Step):
@@ -52,7 +55,7 @@ def get_cutoff_filter_steps(cutoff_filter_next_step_type):
             if not hasattr(ctx.spec.models[-1], "filters") or ctx.spec.models[-1].filters is None:
                 ctx.spec.models[-1].filters = []
 
-            filter_obj = FilterSchema().load(
+            filter_obj = filter_schema.load(
                 {
                     "type": "cutoff",
                     "field": self.filter_field,
@@ -125,7 +128,9 @@ class SubjectGroupFilterStep(Step):
             options = [format_column(variable["name"]) for variable in self.variables]
             values = [[*variable["levels"]] for variable in self.variables]  # make copy
 
-            self.input_view = MultiMultipleChoiceInputView(options, values, checked=values)
+            self.input_view = MultiMultipleChoiceInputView(
+                options, values, checked=[set(row) for row in values]
+            )
 
             self._append_view(self.input_view)
             self._append_view(SpacerView(1))
@@ -151,11 +156,12 @@ class SubjectGroupFilterStep(Step):
 
         if len(self.variables) > 0:
             assert self.choice is not None
+            filters = ctx.spec.models[-1].filters
             for variable, checked in zip(self.variables, self.choice):
                 if not all(checked.values()):
                     levels = [str(k) for k, is_selected in checked.items() if is_selected]
-                    ctx.spec.models[-1].filters.append(
-                        GroupFilterSchema().load(
+                    filters.append(
+                        group_filter_schema.load(
                             {
                                 "action": "include",
                                 "type": "group",
@@ -26,6 +26,8 @@ from ...model import VariableSchema, SpreadsheetFileSchema
 from ...io import loadspreadsheet
 from .utils import format_column
 
+variable_schema = VariableSchema()
+
 next_step_type = SubjectGroupFilterStep
 
 
@@ -90,7 +92,7 @@ class SpreadsheetColumnTypeStep(Step):
                     levels = levels.astype(str).unique().tolist()
                     vardict["levels"] = levels
 
-                var = VariableSchema().load(vardict)
+                var = variable_schema.load(vardict)
                 ctx.spec.files[-1].metadata["variables"].append(var)
 
         ctx.database.put(
@@ -148,7 +150,7 @@ class SpreadsheetIdColumnStep(Step):
     def next(self, ctx):
         if self.choice is not None:
             varname = self.varname_by_str[self.choice]
-            var = VariableSchema().load({"type": "id", "name": varname})
+            var = variable_schema.load({"type": "id", "name": varname})
             ctx.spec.files[-1].metadata["variables"].append(var)
 
         if self.should_run or self.is_first_run:
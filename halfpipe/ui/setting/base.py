@@ -21,6 +21,8 @@ from ...model import SettingSchema, entities, FilterSchema
 from ..utils import forbidden_chars, entity_colors
 from ...utils.format import format_like_bids
 
+filter_schema = FilterSchema()
+
 
 def feature_namefun(ctx):
     featurename = underscore(ctx.spec.features[-1].name)
@@ -81,7 +83,9 @@ def get_setting_init_steps(next_step_type, settingdict={}, namefun=feature_namef
                 self.should_run = True
                 self._append_view(TextView("Specify images to use"))
 
-                self.input_view = MultiMultipleChoiceInputView(options, values, checked=values)
+                self.input_view = MultiMultipleChoiceInputView(
+                    options, values, checked=[set(row) for row in values]
+                )
 
                 self._append_view(self.input_view)
                 self._append_view(SpacerView(1))
@@ -97,10 +101,10 @@ def get_setting_init_steps(next_step_type, settingdict={}, namefun=feature_namef
 
         def next(self, ctx):
             if self.choice is not None:
-                filter_schema = FilterSchema()
-
-                if ctx.spec.settings[-1].get("filters") is None:
-                    ctx.spec.settings[-1]["filters"] = []
+                setting = ctx.spec.settings[-1]
+                if setting.get("filters") is None:
+                    setting["filters"] = []
+                filters = setting["filters"]
 
                 for entity, checked in zip(self.entities, self.choice):
                     if all(checked.values()):
@@ -120,7 +124,7 @@ def get_setting_init_steps(next_step_type, settingdict={}, namefun=feature_namef
                             "values": selected_tagvals,
                         }
                     )
-                    ctx.spec.settings[-1]["filters"].append(filter)
+                    filters.append(filter)
 
             if self.should_run or self.is_first_run:
                 self.is_first_run = False
@@ -25,6 +25,19 @@ from ...model import (
 )
 from ...utils import inflect_engine as p
 
+confounds_options = {
+    "ICA-AROMA": "ICA-AROMA",
+    "Motion parameters": "(trans|rot)_[xyz]",
+    "Derivatives of motion parameters": "(trans|rot)_[xyz]_derivative1",
+    "Motion parameters squared": "(trans|rot)_[xyz]_power2",
+    "Derivatives of motion parameters squared": "(trans|rot)_[xyz]_derivative1_power2",
+    "aCompCor (top five components)": "a_comp_cor_0[0-4]",
+    "White matter signal": "white_matter",
+    "CSF signal": "csf",
+    "Global signal": "global_signal",
+}
+inverse_confounds_options = {v: k for k, v in confounds_options.items()}
+
 
 def get_setting_vals_steps(next_step_type, noun="setting", vals_header_str=None, oncompletefn=None):
     class ConfirmInconsistentStep(YesNoStep):
@@ -46,17 +59,8 @@ def get_setting_vals_steps(next_step_type, noun="setting", vals_header_str=None,
     class ConfoundsSelectStep(Step):
         noun = "confounds"
 
-        options = {
-            "ICA-AROMA": "ICA-AROMA",
-            "Motion parameters": "(trans|rot)_[xyz]",
-            "Derivatives of motion parameters": "(trans|rot)_[xyz]_derivative1",
-            "Motion parameters squared": "(trans|rot)_[xyz]_power2",
-            "Derivatives of motion parameters squared": "(trans|rot)_[xyz]_derivative1_power2",
-            "aCompCor (top five components)": "a_comp_cor_0[0-4]",
-            "White matter signal": "white_matter",
-            "CSF signal": "csf",
-            "Global signal": "global_signal",
-        }
+        options = confounds_options
+        inverse_options = inverse_confounds_options
 
         def setup(self, ctx):
             self._append_view(TextView(f"Remove {self.noun}?"))
@@ -82,8 +86,9 @@ def get_setting_vals_steps(next_step_type, noun="setting", vals_header_str=None,
             suggestion = ["ICA-AROMA"]
 
             if len(self.confs) > 0:
-                inverse_options = {v: k for k, v in self.options.items()}
-                suggestion = [inverse_options[s] for s in self.confs[-1] if s in inverse_options]
+                suggestion = [
+                    self.inverse_options[s] for s in self.confs[-1] if s in self.inverse_options
+                ]
 
             self.input_view = MultipleChoiceInputView(
                 list(self.options.keys()), checked=suggestion, isVertical=True
@@ -145,21 +150,25 @@ def get_setting_vals_steps(next_step_type, noun="setting", vals_header_str=None,
                 feature.setting for feature in ctx.spec.features if hasattr(feature, "setting")
             )
 
-            self.valsets = OrderedDict()
+            bandpass_filters = list()
+            for setting in ctx.spec.settings:
+                if not setting.get("output_image", False) and setting["name"] not in featuresettings:
+                    continue
 
-            for i, key in enumerate(self.keys):
-                self.valsets[key] = list()
-                valset = self.valsets[key]
+                bandpass_filter = setting.get("bandpass_filter")
+                if bandpass_filter is not None:
+                    bandpass_filters.append(bandpass_filter)
 
-                for setting in ctx.spec.settings:
-                    if not setting.get("output_image", False) and setting["name"] not in featuresettings:
-                        continue
+            self.valsets = OrderedDict()
 
-                    bandpass_filter = setting.get("bandpass_filter")
-                    if bandpass_filter is not None and key in bandpass_filter:
-                        valset.append(bandpass_filter[key])
+            for i, key in enumerate(self.keys):
+                self.valsets[key] = [
+                    bandpass_filter[key]
+                    for bandpass_filter in bandpass_filters
+                    if key in bandpass_filter
+                ]
 
-                valset = list(unique_everseen(valset))
+                valset = list(unique_everseen(self.valsets[key]))
 
                 if len(valset) > 0:
                     suggestion[i] = valset[-1]
@@ -8,9 +8,7 @@ from typing import ClassVar, Dict, Optional, Type
 
 from calamities import TextView, SpacerView, TextElement, SingleChoiceInputView
 
-from copy import deepcopy
-
-from ..utils import logger
+from ..utils import logger, deepcopy
 
 
 class Step:
@@ -6,20 +6,26 @@ import re
 from inflection import parameterize, camelize, underscore
 
 
+special_replacements = {"<>": " vs ", ">": " gt ", "<": " lt "}
+special_pattern = re.compile(r"<>|>|<")
+whitespace_pattern = re.compile(r"\s+")
+uppercase_pattern = re.compile(r"([A-Z])")
+uppercase_run_pattern = re.compile(r"([A-Z]+)")
+separator_pattern = re.compile(r"[_-]")
+
+
 def _replace_special(s):
     # replace gt and lt characters because these are confusing in bash later on
-    s = s.replace("<>", " vs ")
-    s = s.replace(">", " gt ")
-    s = s.replace("<", " lt ")
+    s = special_pattern.sub(lambda m: special_replacements[m.group(0)], s)
 
-    s = re.sub(r"\s+", " ", s)  # remove repeated whitespace
+    s = whitespace_pattern.sub(" ", s)  # remove repeated whitespace
 
     return s
 
 
 def format_like_bids(name):
     s = camelize(name)  # convert underscores to camel case
-    s = re.sub(r"([A-Z])", r" \1", s)  # convert camel case into words
+    s = uppercase_pattern.sub(r" \1", s)  # convert camel case into words
 
     s = _replace_special(s)
 
@@ -31,8 +37,8 @@ def format_like_bids(name):
 
 
 def format_workflow(s):
-    s = re.sub(r"[_-]", " ", s)  # convert underscores to spaces
-    s = re.sub(r"([A-Z]+)", r" \1", s)  # convert camel case into words
+    s = separator_pattern.sub(" ", s)  # convert underscores to spaces
+    s = uppercase_run_pattern.sub(r" \1", s)  # convert camel case into words
 
     s = _replace_special(s)
 
@@ -12,6 +12,8 @@ from ..format import format_like_bids, format_workflow
     [
         ("seedCorr", "seedCorr"),
         ("faces>shapes", "facesGtShapes"),
+        ("faces<>shapes", "facesVsShapes"),
+        ("faces<shapes>houses", "facesLtShapesGtHouses"),
         ("faces-vs-shapes", "facesVsShapes"),
         ("fALFF", "fALFF"),
         ("PIAB_1234", "PIAB1234"),
@@ -2,16 +2,30 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
-from typing import List, Dict, Set, Tuple, Union
+from typing import DefaultDict, List, Dict, Set, Tuple, Union
+
+from collections import defaultdict
 
 from nibabel.nifti1 import Nifti1Header
 
 from ..model.setting import BaseSettingSchema
+from ..model.tags import entities
 from ..io.metadata.niftiheader import NiftiheaderLoader
 from ..io.metadata.direction import get_axcodes_set
 from ..io.index.bids import BidsDatabase, get_file_metadata
 from ..io.index.database import Database
 from ..utils import logger, nvol
+from ..utils.format import format_like_bids
+
+
+def _nvol(bold_file_path: str) -> int:
+    header, _ = NiftiheaderLoader.load(bold_file_path)  # cached
+    if header is None:
+        return nvol(bold_file_path)
+    data_shape = header.get_data_shape()
+    if len(data_shape) > 3:
+        return int(data_shape[3])
+    return 1
 
 
 def collect_events(
@@ -29,20 +43,20 @@ def collect_events(
     if candidates is None or len(candidates) == 0:
         return None
 
-    candidates = sorted(set(candidates))  # remove duplicates
+    tagvals = database.multitagvals(["sub", "extension", "condition"], candidates)
 
     def match_subject(event_file):
-        subject = database.tagval(event_file, "sub")
+        subject = tagvals[event_file]["sub"]
 
         if subject is not None:
             return subject == sourcefile_subject
         else:
             return True
 
-    condition_files = list(filter(match_subject, candidates))
+    # associations are already unique, so we only need to sort the matches
+    condition_files = sorted(filter(match_subject, candidates))
 
-    extensions = database.tagvalset("extension", filepaths=condition_files)
-    assert extensions is not None
+    extensions = set(tagvals[condition_file]["extension"] for condition_file in condition_files)
 
     if len(condition_files) == 0:
         return None  # we did not find any
@@ -54,7 +68,7 @@ def collect_events(
         condition_tuples: List[Tuple[str, str]] = list()
 
         for condition_file in condition_files:
-            condition = database.tagval(condition_file, "condition")
+            condition = tagvals[condition_file]["condition"]
             assert isinstance(condition, str)
             condition_tuples.append((condition_file, condition))
 
@@ -76,14 +90,12 @@ def collect_fieldmaps(database: Database, bold_file_path: str) -> List[str]:
     if candidates is None:
         return list()
 
-    candidates = sorted(set(candidates))
-
-    return candidates
+    return sorted(candidates)  # associations are already unique
 
 
 def collect_bold_files(
     database, setting_factory, feature_factory
-) -> Dict[str, List[str]]:
+) -> Dict[str, Tuple[str, ...]]:
 
     # find bold files
 
@@ -91,7 +103,7 @@ def collect_bold_files(
 
     # filter
 
-    bold_file_paths_dict = dict()
+    bold_file_paths_dict: Dict[str, Tuple[str, ...]] = dict()
 
     for bold_file_path in bold_file_paths:
 
@@ -105,18 +117,35 @@ def collect_bold_files(
         if t1ws is None:  # remove bold files without T1w
             continue
 
-        associated_file_paths = [bold_file_path, *t1ws]
-
-        fmaps = collect_fieldmaps(database, bold_file_path)
-        if fmaps is not None:
-            associated_file_paths.extend(fmaps)  # add all fmaps for now, filter later
+        fmaps = collect_fieldmaps(database, bold_file_path)  # add all fmaps for now, filter later
 
-        bold_file_paths_dict[bold_file_path] = associated_file_paths
+        bold_file_paths_dict[bold_file_path] = (bold_file_path, *t1ws, *fmaps)
 
     bold_file_paths = [b for b in bold_file_paths if b in bold_file_paths_dict]
 
+    if len(bold_file_paths) < 2:
+        return bold_file_paths_dict  # nothing to deduplicate
+
+    # the bids path patterns ignore some entities, so unique tags do not
+    # imply unique bids paths. however, BidsDatabase.put rejects a file
+    # whose bids path is already taken, so files with unique tags after
+    # formatting never end up in the same set in bids_dict below, and we
+    # can skip building the bids paths. the metadata that put fills in is
+    # filled in again when convert_all puts the files into the bids
+    # database of the workflow
+
+    def bids_tag_tuple(bold_file_path: str) -> Tuple:
+        tags = database.tags(bold_file_path)
+        return tuple(sorted(
+            (k, format_like_bids(v) if k in entities else v) for k, v in tags.items()
+        ))
+
+    tag_tuples = set(map(bids_tag_tuple, bold_file_paths))
+    if len(tag_tuples) == len(bold_file_paths):
+        return bold_file_paths_dict
+
     _bids_database = BidsDatabase(database)
-    bids_dict: Dict[str, Set[str]] = dict()
+    bids_dict: DefaultDict[str, Set[str]] = defaultdict(set)
     for bold_file_path in bold_file_paths:
 
         # check for duplicate tags via bids path as this contains all tags by definition
@@ -131,9 +160,6 @@ def collect_bold_files(
 
         assert bids_path is not None
 
-        if bids_path not in bids_dict:
-            bids_dict[bids_path] = set()
-
         bids_dict[bids_path].add(bold_file_path)
 
     for bold_file_pathset in bids_dict.values():
@@ -146,7 +172,7 @@ def collect_bold_files(
         # had to be restarted
 
         nvol_dict = {
-            bold_file_path: nvol(bold_file_path) for bold_file_path in bold_file_pathset
+            bold_file_path: _nvol(bold_file_path) for bold_file_path in bold_file_pathset
         }
         max_nvol = max(nvol_dict.values())
         selected = set(
@@ -206,13 +232,12 @@ def collect_metadata(database, source_file, setting) -> Dict:
     header, _ = NiftiheaderLoader.load(source_file)
     assert isinstance(header, Nifti1Header)
 
-    zooms = list(map(float, header.get_zooms()))
-    assert all(isinstance(z, float) for z in zooms)
-    metadata["acquisition_voxel_size"] = tuple(zooms[:3])
+    zooms = header.get_zooms()
+    metadata["acquisition_voxel_size"] = tuple(float(z) for z in zooms[:3])
 
     data_shape = header.get_data_shape()
     assert len(data_shape) == 4
-    metadata["acquisition_volume_shape"] = tuple(data_shape[:3])
+    metadata["acquisition_volume_shape"] = tuple(int(s) for s in data_shape[:3])
     metadata["number_of_volumes"] = int(data_shape[3])
 
     (axcodes,) = get_axcodes_set(source_file)
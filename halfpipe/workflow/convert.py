@@ -2,7 +2,7 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
-from typing import List, Dict
+from typing import Dict, Tuple
 
 from pathlib import Path
 
@@ -13,7 +13,7 @@ from ..utils import logger
 def convert_all(
         database: Database,
         bids_database: BidsDatabase,
-        bold_paths_dict: Dict[str, List[str]]
+        bold_paths_dict: Dict[str, Tuple[str, ...]]
 ):
     for bold_path, associated_paths in bold_paths_dict.items():
 
@@ -31,6 +31,8 @@ from .constants import constants
 
 max_chunk_size = 50  # subjects
 
+subject_wf_pattern = re.compile(r"single_subject_(?P<subjectname>.+)_wf")
+
 
 class IdentifiableDiGraph(nx.DiGraph):
     uuid: Optional[str]
@@ -59,7 +61,9 @@ def filter_subject_graphs(subject_graphs: OrderedDict, opts: Namespace) -> Order
                 s.strip() for s in f.readlines()
             )
 
-        for subject in subject_set:
+        # iterate over a snapshot, as adding to the set while iterating over it
+        # raises a RuntimeError
+        for subject in tuple(subject_set):
             subject_set.add(format_like_bids(subject))
 
         subject_graphs = OrderedDict([
@@ -72,7 +76,7 @@ def filter_subject_graphs(subject_graphs: OrderedDict, opts: Namespace) -> Order
 
 
 def extract_subject_name(hierarchy):
-    m = re.fullmatch(r"single_subject_(?P<subjectname>.+)_wf", hierarchy[2])
+    m = subject_wf_pattern.fullmatch(hierarchy[2])
     if m is not None:
         return m.group("subjectname")
 
@@ -140,12 +144,13 @@ def resolve_input_boundary(flat_graph, non_subject_nodes):
 
         connections = c["connect"]
         result = pre_run_result_dict[u]
+        outputs = result.outputs.trait_get()
 
         for u_field, v_field in connections:
             if isinstance(u_field, tuple):
                 raise NotImplementedError()
 
-            value = result.outputs.trait_get()[u_field]
+            value = outputs[u_field]
             v.set_input(v_field, value)
 
     for u in pre_run_result_dict.keys():
@@ -465,7 +465,7 @@ class SettingFactory(Factory):
 
                 metadata = collect_metadata(self.database, sourcefile, setting)
                 if raw_sources_dict.get(sourcefile) is not None:
-                    metadata["raw_sources"] = raw_sources_dict.get(sourcefile)
+                    metadata["raw_sources"] = list(raw_sources_dict[sourcefile])
                 inputnode.inputs.metadata = metadata
 
                 self.connect(